@@ -3,42 +3,56 @@
 parse-issues.py — Parser for .issues.md files
 
 Commands:
-  next <file>                     → Print next eligible issue (Ready + deps Done)
+  next <file> [count]             → Print next eligible issue(s) (Ready + deps Done)
   detail <file> <issue_id>        → Print full issue block
   update-status <file> <id> <st>  → Update an issue's status in-place
   update-notes <file> <id> <note> → Append to an issue's dev notes
+  update-batch <file> [edits]     → Apply a JSON list of edits in one write
+                                    (from a file, or stdin if omitted or "-")
   promote <file>                  → Promote Backlog → Ready when deps are Done
   summary <file>                  → Print one-line-per-issue summary
 """
 
 import sys
 import re
+import json
+import itertools
 from pathlib import Path
 
 
+_BLOCK_SPLIT_RE = re.compile(r'\n---\n')
+_TITLE_RE = re.compile(r'###\s+(ISSUE-\d+):\s*(.+)')
+_ISSUE_ID_RE = re.compile(r'ISSUE-\d+')
+# The value is captured inside a lookahead so an empty field never swallows
+# the next field's line — each label is matched exactly once per block.
+_FIELD_RE = re.compile(
+    r'\*\*(Status|Dependencies|Complexity|Layers|Files likely touched):\*\*(?=\s*(.+))'
+)
+
+
 def parse_issues(filepath: str) -> list[dict]:
     """Parse a .issues.md file into a list of issue dicts."""
-    content = Path(filepath).read_text()
-    issue_blocks = re.split(r'\n---\n', content)
+    content = Path(filepath).read_text(encoding='utf-8')
 
     issues = []
-    for block in issue_blocks:
-        title_match = re.search(r'###\s+(ISSUE-\d+):\s*(.+)', block)
+    for start, end in _iter_blocks(content):
+        title_match = _TITLE_RE.search(content, start, end)
         if not title_match:
             continue
 
         issue_id = title_match.group(1)
         title = title_match.group(2).strip()
 
-        status = _extract_field(block, 'Status') or 'Backlog'
-        deps_raw = _extract_field(block, 'Dependencies') or 'none'
-        complexity = _extract_field(block, 'Complexity') or 'M'
-        layers = _extract_field(block, 'Layers') or ''
-        files = _extract_field(block, 'Files likely touched') or ''
+        fields = _parse_fields(content, start, end)
+        status = fields.get('Status') or 'Backlog'
+        deps_raw = fields.get('Dependencies') or 'none'
+        complexity = fields.get('Complexity') or 'M'
+        layers = fields.get('Layers') or ''
+        files = fields.get('Files likely touched') or ''
 
         deps = []
         if deps_raw.strip().lower() != 'none':
-            deps = [d.strip() for d in re.findall(r'ISSUE-\d+', deps_raw)]
+            deps = [d.strip() for d in _ISSUE_ID_RE.findall(deps_raw)]
 
         issues.append({
             'id': issue_id,
@@ -48,70 +62,138 @@ def parse_issues(filepath: str) -> list[dict]:
             'complexity': complexity.strip(),
             'layers': layers.strip(),
             'files': files.strip(),
-            'raw_block': block.strip(),
+            'raw_block': content[start:end].strip(),
         })
 
     return issues
 
 
-def _extract_field(block: str, field_name: str) -> str | None:
-    """Extract a **Field:** value from a markdown block."""
-    pattern = rf'\*\*{re.escape(field_name)}:\*\*\s*(.+)'
-    match = re.search(pattern, block)
-    return match.group(1).strip() if match else None
+def _iter_blocks(content: str):
+    """Yield (start, end) offsets of the ---separated blocks in content.
 
+    Offsets let the parser search blocks in place; only issue blocks are
+    ever sliced out of the file.
+    """
+    start = 0
+    for sep in _BLOCK_SPLIT_RE.finditer(content):
+        yield start, sep.start()
+        start = sep.end()
+    yield start, len(content)
 
-def find_next_issue(issues: list[dict]) -> dict | None:
-    """Find the next issue that is Ready and has all dependencies Done."""
-    done_ids = {i['id'] for i in issues if i['status'] == 'Done'}
 
-    for issue in issues:
-        if issue['status'] != 'Ready':
-            continue
-        if all(dep in done_ids for dep in issue['dependencies']):
-            return issue
+def _parse_fields(content: str, start: int, end: int) -> dict[str, str]:
+    """Extract all **Field:** values from content[start:end] in a single scan.
 
-    return None
+    The first occurrence of each field wins.
+    """
+    fields = {}
+    for match in _FIELD_RE.finditer(content, start, end):
+        fields.setdefault(match.group(1), match.group(2).strip())
+    return fields
 
 
-def update_status(filepath: str, issue_id: str, new_status: str):
-    """Update an issue's status in the file."""
-    content = Path(filepath).read_text()
+def find_next_issue(issues: list[dict]) -> dict | None:
+    """Find the next issue that is Ready and has all dependencies Done."""
+    ready = find_next_issues(issues, limit=1)
+    return ready[0] if ready else None
 
-    # Match the status line for the specific issue
-    # Status values can be multi-word (e.g., "In Progress", "In Review")
-    pattern = rf'(###\s+{re.escape(issue_id)}:.*?\n(?:.*?\n)*?\*\*Status:\*\*)\s+(.+)'
-    match = re.search(pattern, content)
 
-    if not match:
-        print(f"ERROR: Could not find status for {issue_id}", file=sys.stderr)
-        sys.exit(1)
+def find_next_issues(issues: list[dict], limit: int | None = None) -> list[dict]:
+    """Find up to limit issues that are Ready with all dependencies Done.
 
-    # Replace only the status value, preserving everything else
-    old_status = match.group(2).strip()
-    content = content[:match.start(2)] + f" {new_status}" + content[match.end(2):]
+    Issues come back in file order, which is the implementation order.
+    """
+    done_ids = {i['id'] for i in issues if i['status'] == 'Done'}
+    ready = (
+        issue for issue in issues
+        if issue['status'] == 'Ready' and done_ids.issuperset(issue['dependencies'])
+    )
+    return list(itertools.islice(ready, limit))
 
-    Path(filepath).write_text(content)
+
+def update_status(filepath: str, issue_id: str, new_status: str):
+    """Update an issue's status in the file."""
+    apply_updates(filepath, [{'id': issue_id, 'status': new_status}])
 
 
 def update_dev_notes(filepath: str, issue_id: str, notes: str):
     """Append to an issue's dev notes."""
-    content = Path(filepath).read_text()
+    apply_updates(filepath, [{'id': issue_id, 'notes': notes}])
 
-    # Find the dev notes field for this issue
-    pattern = rf'(###\s+{re.escape(issue_id)}:.*?(?:\n.*?)*?\*\*Dev notes:\*\*)\s*(.*?)(?=\n---|\n###|\Z)'
-    match = re.search(pattern, content, re.DOTALL)
 
-    if match:
-        existing = match.group(2).strip()
-        if existing and existing != '_(filled by dev-loop during implementation)_':
-            new_notes = f"{existing}\n{notes}"
-        else:
-            new_notes = notes
-        content = content[:match.start(2)] + f" {new_notes}" + content[match.end(2):]
-        Path(filepath).write_text(content)
-    else:
-        print(f"WARNING: No dev notes field found for {issue_id}", file=sys.stderr)
+def apply_updates(filepath: str, edits: list[dict]):
+    """Apply several edits to the file with a single read and write.
+
+    Each edit is a dict with an 'id' and optional 'status' (new status)
+    and 'notes' (text to append to the dev notes) keys.
+    """
+    original = Path(filepath).read_text(encoding='utf-8')
+    lines = original.splitlines(keepends=True)
+
+    for edit in edits:
+        if 'status' in edit:
+            _set_status(lines, edit['id'], edit['status'])
+        if 'notes' in edit:
+            _append_dev_notes(lines, edit['id'], edit['notes'])
+
+    content = ''.join(lines)
+    if content != original:
+        Path(filepath).write_text(content, encoding='utf-8')
+
+
+def _issue_span(lines: list[str], issue_id: str) -> tuple[int, int] | None:
+    """Return the [start, end) line range of an issue's block, or None."""
+    start = None
+    for i, line in enumerate(lines):
+        if start is None:
+            match = _TITLE_RE.match(line)
+            if match and match.group(1) == issue_id:
+                start = i
+        elif line.startswith('###') or line.rstrip() == '---':
+            return start, i
+    return (start, len(lines)) if start is not None else None
+
+
+def _line_ending(line: str) -> str:
+    return line[len(line.rstrip('\r\n')):]
+
+
+def _set_status(lines: list[str], issue_id: str, new_status: str):
+    """Replace an issue's status line in place."""
+    span = _issue_span(lines, issue_id)
+    if span:
+        for i in range(*span):
+            if lines[i].startswith('**Status:**'):
+                lines[i] = f"**Status:** {new_status}{_line_ending(lines[i])}"
+                return
+
+    print(f"ERROR: Could not find status for {issue_id}", file=sys.stderr)
+    sys.exit(1)
+
+
+def _append_dev_notes(lines: list[str], issue_id: str, notes: str):
+    """Append to an issue's dev notes in place."""
+    span = _issue_span(lines, issue_id)
+    if span:
+        start, end = span
+        for i in range(start, end):
+            if not lines[i].startswith('**Dev notes:**'):
+                continue
+
+            # Notes run to the end of the block, minus trailing blank lines
+            last = end
+            while last > i + 1 and not lines[last - 1].strip():
+                last -= 1
+            existing = ''.join(lines[i:last])[len('**Dev notes:**'):].strip()
+
+            if existing and existing != '_(filled by dev-loop during implementation)_':
+                new_notes = f"{existing}\n{notes}"
+            else:
+                new_notes = notes
+            lines[i:last] = [f"**Dev notes:** {new_notes}{_line_ending(lines[last - 1])}"]
+            return
+
+    print(f"WARNING: No dev notes field found for {issue_id}", file=sys.stderr)
 
 
 def promote_eligible(filepath: str) -> list[str]:
@@ -127,30 +209,55 @@ def promote_eligible(filepath: str) -> list[str]:
         if issue['status'] != 'Backlog':
             continue
         if not issue['dependencies'] or all(dep in done_ids for dep in issue['dependencies']):
-            update_status(filepath, issue['id'], 'Ready')
             promoted.append(issue['id'])
 
+    apply_updates(filepath, [{'id': pid, 'status': 'Ready'} for pid in promoted])
     return promoted
 
 
+_NC = '\033[0m'
+_STATUS_COLORS = {
+    'Backlog': '\033[90m',      # gray
+    'Ready': '\033[0;34m',      # blue
+    'In Progress': '\033[1;33m', # yellow
+    'In Review': '\033[0;35m',   # purple
+    'Done': '\033[0;32m',       # green
+}
+# Pre-rendered "[  Status  ]" labels for the known statuses
+_STATUS_LABELS = {
+    status: f"{color}[{status:^12}]{_NC}" for status, color in _STATUS_COLORS.items()
+}
+
+
 def print_summary(issues: list[dict]):
     """Print a one-line summary per issue."""
-    status_colors = {
-        'Backlog': '\033[90m',      # gray
-        'Ready': '\033[0;34m',      # blue
-        'In Progress': '\033[1;33m', # yellow
-        'In Review': '\033[0;35m',   # purple
-        'Done': '\033[0;32m',       # green
-    }
-    nc = '\033[0m'
-
+    lines = []
     for issue in issues:
-        color = status_colors.get(issue['status'], nc)
+        status = issue['status']
+        label = _STATUS_LABELS.get(status) or f"{_NC}[{status:^12}]{_NC}"
         deps = ', '.join(issue['dependencies']) if issue['dependencies'] else '-'
-        print(f"  {color}[{issue['status']:^12}]{nc}  {issue['id']}: {issue['title']}  (deps: {deps})")
+        lines.append(f"  {label}  {issue['id']}: {issue['title']}  (deps: {deps})\n")
+    sys.stdout.write(''.join(lines))
 
 
 # --- CLI --------------------------------------------------------------------
+def _validate_edits(edits) -> str | None:
+    """Return why a parsed update-batch payload is unusable, or None if valid."""
+    if not isinstance(edits, list):
+        return "expected a JSON list of edits"
+    for n, edit in enumerate(edits):
+        if not isinstance(edit, dict):
+            return f"edit {n} is not an object"
+        if not isinstance(edit.get('id'), str):
+            return f"edit {n} has no string \"id\""
+        if 'status' not in edit and 'notes' not in edit:
+            return f"edit {n} ({edit['id']}) has neither \"status\" nor \"notes\""
+        for key in ('status', 'notes'):
+            if key in edit and not isinstance(edit[key], str):
+                return f"edit {n} ({edit['id']}) has a non-string \"{key}\""
+    return None
+
+
 def main():
     if len(sys.argv) < 3:
         print(__doc__)
@@ -158,13 +265,20 @@ def main():
 
     command = sys.argv[1]
     filepath = sys.argv[2]
-    issues = parse_issues(filepath)
 
     if command == 'next':
-        issue = find_next_issue(issues)
-        if issue:
-            print(issue['id'])
-            print(issue['title'])
+        try:
+            count = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+        except ValueError:
+            count = 0
+        if count < 1:
+            print("Usage: parse-issues.py next <file> [count]  (count must be a positive integer)", file=sys.stderr)
+            sys.exit(1)
+        ready = find_next_issues(parse_issues(filepath), limit=count)
+        if ready:
+            for issue in ready:
+                print(issue['id'])
+                print(issue['title'])
         else:
             print("NONE")
 
@@ -173,7 +287,7 @@ def main():
             print("Usage: parse-issues.py detail <file> <issue_id>", file=sys.stderr)
             sys.exit(1)
         issue_id = sys.argv[3]
-        for issue in issues:
+        for issue in parse_issues(filepath):
             if issue['id'] == issue_id:
                 print(issue['raw_block'])
                 sys.exit(0)
@@ -192,6 +306,21 @@ def main():
             sys.exit(1)
         update_dev_notes(filepath, sys.argv[3], sys.argv[4])
 
+    elif command == 'update-batch':
+        # Edits: [{"id": "ISSUE-1", "status": "Done", "notes": "..."}, ...]
+        source = sys.argv[3] if len(sys.argv) > 3 else '-'
+        raw = sys.stdin.read() if source == '-' else Path(source).read_text(encoding='utf-8')
+        try:
+            edits = json.loads(raw)
+        except json.JSONDecodeError as e:
+            print(f"ERROR: Invalid edits JSON: {e}", file=sys.stderr)
+            sys.exit(1)
+        error = _validate_edits(edits)
+        if error:
+            print(f"ERROR: Invalid edits: {error}", file=sys.stderr)
+            sys.exit(1)
+        apply_updates(filepath, edits)
+
     elif command == 'promote':
         promoted = promote_eligible(filepath)
         if promoted:
@@ -201,7 +330,7 @@ def main():
             print("  No issues to promote")
 
     elif command == 'summary':
-        print_summary(issues)
+        print_summary(parse_issues(filepath))
 
     else:
         print(f"Unknown command: {command}", file=sys.stderr)
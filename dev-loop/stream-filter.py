@@ -20,16 +20,19 @@ DIM = '\033[2m'
 BOLD = '\033[1m'
 NC = '\033[0m'
 
+# File tools: tool name → pre-rendered label, shown with the file path
+_FILE_TOOLS = {
+    "Read": f"{CYAN}📖 Read{NC}",
+    "Write": f"{GREEN}📝 Write{NC}",
+    "Edit": f"{YELLOW}✏️  Edit{NC}",
+}
+
+
 def format_tool(tool_name: str, tool_input: dict) -> str:
-    if tool_name == "Read":
-        path = tool_input.get("file_path", tool_input.get("path", "?"))
-        return f"{CYAN}📖 Read{NC} {path}"
-    elif tool_name == "Write":
+    label = _FILE_TOOLS.get(tool_name)
+    if label is not None:
         path = tool_input.get("file_path", tool_input.get("path", "?"))
-        return f"{GREEN}📝 Write{NC} {path}"
-    elif tool_name == "Edit":
-        path = tool_input.get("file_path", tool_input.get("path", "?"))
-        return f"{YELLOW}✏️  Edit{NC} {path}"
+        return f"{label} {path}"
     elif tool_name.startswith("Bash"):
         cmd = tool_input.get("command", tool_input.get("cmd", "?"))
         # Truncate long commands
@@ -42,15 +45,14 @@ def format_tool(tool_name: str, tool_input: dict) -> str:
 
 def main():
     final_text = []
+    out = sys.stdout
 
-    for line in sys.stdin:
-        line = line.strip()
-        if not line:
-            continue
-
+    # json.loads takes the raw bytes and ignores surrounding whitespace, so
+    # there is no need to decode or strip each line first
+    for line in sys.stdin.buffer:
         try:
             event = json.loads(line)
-        except json.JSONDecodeError:
+        except ValueError:
             continue
 
         event_type = event.get("type", "")
@@ -59,11 +61,16 @@ def main():
         if event_type == "assistant" and "message" in event:
             msg = event["message"]
             if isinstance(msg, dict):
-                for block in msg.get("content", []):
-                    if block.get("type") == "tool_use":
-                        tool_name = block.get("name", "?")
-                        tool_input = block.get("input", {})
-                        print(f"  {format_tool(tool_name, tool_input)}", flush=True)
+                tool_lines = [
+                    f"  {format_tool(block.get('name', '?'), block.get('input', {}))}\n"
+                    for block in msg.get("content", [])
+                    if block.get("type") == "tool_use"
+                ]
+                # One write + flush per event keeps progress live without
+                # a syscall per tool call
+                if tool_lines:
+                    out.write(''.join(tool_lines))
+                    out.flush()
 
         # Tool result
         elif event_type == "result":
@@ -73,10 +80,12 @@ def main():
 
     # Print final summary
     if final_text:
-        print(f"\n{BOLD}{'─' * 50}{NC}")
-        print(f"{BOLD}Implementation summary:{NC}\n")
-        for text in final_text:
-            print(text)
+        out.write(
+            f"\n{BOLD}{'─' * 50}{NC}\n"
+            f"{BOLD}Implementation summary:{NC}\n\n"
+            + ''.join(f"{text}\n" for text in final_text)
+        )
+        out.flush()
 
 
 if __name__ == "__main__":
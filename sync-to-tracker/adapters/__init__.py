@@ -1,6 +1,7 @@
 """Base adapter interface for tracker integrations."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 
 class BaseAdapter(ABC):
@@ -11,11 +12,37 @@ class BaseAdapter(ABC):
     1. Create a new file in adapters/ (e.g., jira.py)
     2. Implement a class called Adapter(BaseAdapter)
     3. Add the tracker name to .sync-config.json
+
+    The bulk methods' defaults call the single-item methods from several
+    threads at once, so those must be safe to call concurrently (or set
+    "max_concurrency": 1).
     """
 
     def __init__(self, config: dict, issues_file: str = ""):
         self.config = config
         self.issues_file = issues_file
+        # Upper bound on tracker requests in flight at once
+        self.max_concurrency = max(1, int(config.get("max_concurrency", 4)))
+
+    def close(self):
+        """Release any network resources held by the adapter."""
+
+    def _map(self, fn, items: list) -> list:
+        """Call fn on each item, returning results in order.
+
+        Calls are independent tracker requests, so up to max_concurrency
+        of them are in flight at once.
+        """
+        if len(items) <= 1 or self.max_concurrency <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
     @abstractmethod
     def create_item(
@@ -41,6 +68,22 @@ class BaseAdapter(ABC):
         """
         ...
 
+    def create_items(self, items: list[dict]) -> list[str]:
+        """
+        Create several items in the tracker.
+
+        The default calls create_item() per item, up to max_concurrency at
+        a time; override it when the tracker API can create many items in
+        a single request.
+
+        Args:
+            items: Dicts of create_item() keyword arguments
+
+        Returns:
+            tracker_ids: IDs of the created items, in the same order
+        """
+        return self._map(lambda item: self.create_item(**item), items)
+
     @abstractmethod
     def update_status(self, tracker_id: str, status: str):
         """
@@ -52,6 +95,19 @@ class BaseAdapter(ABC):
         """
         ...
 
+    def update_statuses(self, updates: list[tuple[str, str]]):
+        """
+        Update the status of several existing items.
+
+        The default calls update_status() per item, up to max_concurrency
+        at a time; override it when the tracker API can change many items
+        in a single request.
+
+        Args:
+            updates: (tracker_id, status) pairs
+        """
+        self._map(lambda update: self.update_status(*update), updates)
+
     @abstractmethod
     def update_description(self, tracker_id: str, description: str):
         """
@@ -63,6 +119,19 @@ class BaseAdapter(ABC):
         """
         ...
 
+    def update_descriptions(self, updates: list[tuple[str, str]]):
+        """
+        Replace the description of several existing items.
+
+        The default calls update_description() per item, up to
+        max_concurrency at a time; override it when the tracker API can
+        change many items in a single request.
+
+        Args:
+            updates: (tracker_id, description) pairs
+        """
+        self._map(lambda update: self.update_description(*update), updates)
+
     @abstractmethod
     def archive_item(self, tracker_id: str):
         """
@@ -73,6 +142,19 @@ class BaseAdapter(ABC):
         """
         ...
 
+    def archive_items(self, tracker_ids: list[str]):
+        """
+        Archive several items in the tracker.
+
+        The default calls archive_item() per item, up to max_concurrency at
+        a time; override it when the tracker API can change many items in
+        a single request.
+
+        Args:
+            tracker_ids: The tracker's item IDs
+        """
+        self._map(self.archive_item, tracker_ids)
+
     @abstractmethod
     def update_title(self, tracker_id: str, title: str):
         """
@@ -83,3 +165,16 @@ class BaseAdapter(ABC):
             title: New item title
         """
         ...
+
+    def update_titles(self, updates: list[tuple[str, str]]):
+        """
+        Update the title of several existing items.
+
+        The default calls update_title() per item, up to max_concurrency at
+        a time; override it when the tracker API can change many items in
+        a single request.
+
+        Args:
+            updates: (tracker_id, title) pairs
+        """
+        self._map(lambda update: self.update_title(*update), updates)
@@ -1,12 +1,146 @@
 """Monday.com adapter for sync-to-tracker."""
 
+import re
 import json
-import urllib.request
-import urllib.error
+import time
+import queue
+import functools
+import http.client
+from urllib.parse import urlsplit
 from . import BaseAdapter
 
 
 API_URL = "https://api.monday.com/v2"
+_API = urlsplit(API_URL)
+
+# Monday caps update bodies; the markdown source is cut first (with headroom
+# for HTML tag expansion) so long descriptions aren't converted only to be
+# thrown away
+_MAX_UPDATE_HTML = 5000
+_MAX_UPDATE_SOURCE = 4000
+
+# Rate-limited requests are retried with exponential backoff, waiting as long
+# as the server asks when it says so. Gateway errors may come back after the
+# mutation was applied, so those are retried only for idempotent ones
+# (status, title, archive) — never for creates, which would duplicate items.
+_MAX_RETRIES = 4
+_RETRY_BASE_DELAY = 1.0
+_RETRY_STATUSES = {429}
+_IDEMPOTENT_RETRY_STATUSES = {502, 503, 504}
+
+# Mutations per request when batching — keeps each request well inside
+# Monday's per-query complexity budget
+_BATCH_SIZE = 25
+
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_CODE_RE = re.compile(r'`(.+?)`')
+
+
+def _inline(s: str) -> str:
+    """Convert markdown inline formatting to HTML."""
+    if '**' not in s and '`' not in s:
+        return s
+    return _CODE_RE.sub(r'<code>\1</code>', _BOLD_RE.sub(r'<strong>\1</strong>', s))
+
+
+@functools.lru_cache(maxsize=32)
+def _status_value(label: str) -> str:
+    """JSON-encoded status column value (a handful of labels, reused a lot)."""
+    return json.dumps({"label": label})
+
+
+# --- Query texts ------------------------------------------------------------
+# Only the variables change between calls, so each query is built once.
+@functools.lru_cache(maxsize=None)
+def _create_items_query(count: int, with_group: bool) -> str:
+    """Aliased create_item mutation (m0, m1, ...) for count items."""
+    params = ["$board: ID!"]
+    if with_group:
+        params.append("$group: String")
+    group_arg = "group_id: $group, " if with_group else ""
+
+    mutations = []
+    for i in range(count):
+        params.append(f"$name{i}: String!, $values{i}: JSON")
+        mutations.append(
+            f"m{i}: create_item(board_id: $board, {group_arg}"
+            f"item_name: $name{i}, column_values: $values{i}) {{ id }}"
+        )
+    return f"mutation ({', '.join(params)}) {{ {' '.join(mutations)} }}"
+
+
+@functools.lru_cache(maxsize=None)
+def _change_statuses_query(count: int) -> str:
+    """Aliased change_column_value mutation (s0, s1, ...) for count items."""
+    params = ["$board: ID!", "$column: String!"]
+    mutations = []
+    for i in range(count):
+        params.append(f"$item{i}: ID!, $value{i}: JSON!")
+        mutations.append(
+            f"s{i}: change_column_value(board_id: $board, item_id: $item{i}, "
+            f"column_id: $column, value: $value{i}) {{ id }}"
+        )
+    return f"mutation ({', '.join(params)}) {{ {' '.join(mutations)} }}"
+
+
+@functools.lru_cache(maxsize=None)
+def _create_updates_query(count: int) -> str:
+    """Aliased create_update mutation (u0, u1, ...) for count updates."""
+    params = []
+    mutations = []
+    for i in range(count):
+        params.append(f"$item{i}: ID!, $body{i}: String!")
+        mutations.append(f"u{i}: create_update(item_id: $item{i}, body: $body{i}) {{ id }}")
+    return f"mutation ({', '.join(params)}) {{ {' '.join(mutations)} }}"
+
+
+@functools.lru_cache(maxsize=None)
+def _archive_items_query(count: int) -> str:
+    """Aliased archive_item mutation (a0, a1, ...) for count items."""
+    params = []
+    mutations = []
+    for i in range(count):
+        params.append(f"$item{i}: ID!")
+        mutations.append(f"a{i}: archive_item(item_id: $item{i}) {{ id }}")
+    return f"mutation ({', '.join(params)}) {{ {' '.join(mutations)} }}"
+
+
+@functools.lru_cache(maxsize=None)
+def _change_titles_query(count: int) -> str:
+    """Aliased change_simple_column_value mutation (t0, t1, ...) on the name column."""
+    params = ["$board: ID!"]
+    mutations = []
+    for i in range(count):
+        params.append(f"$item{i}: ID!, $title{i}: String!")
+        mutations.append(
+            f"t{i}: change_simple_column_value(board_id: $board, item_id: $item{i}, "
+            f'column_id: "name", value: $title{i}) {{ id }}'
+        )
+    return f"mutation ({', '.join(params)}) {{ {' '.join(mutations)} }}"
+
+
+def _seconds(value) -> float | None:
+    """Parse a retry hint in seconds, or None if absent or not a number."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_hint(errors) -> float | None:
+    """Seconds to wait from a GraphQL error's retry_in_seconds, if any."""
+    for error in errors if isinstance(errors, list) else []:
+        if isinstance(error, dict):
+            seconds = _seconds((error.get("extensions") or {}).get("retry_in_seconds"))
+            if seconds is not None:
+                return seconds
+    return None
+
+
+def _chunks(items: list, size: int = _BATCH_SIZE):
+    """Yield successive slices of at most size items."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
 
 
 class Adapter(BaseAdapter):
@@ -49,10 +183,13 @@ class Adapter(BaseAdapter):
         self.api_token = self.monday_config.get("api_token", "")
         self.board_id = self.monday_config.get("board_id", "")
         self.group_mapping = self.monday_config.get("group_mapping", {})
+        # Resolve group_id from mapping
+        self.group_id = self.group_mapping.get(issues_file) or self.group_mapping.get("default")
         self.status_column_id = self.monday_config.get("status_column_id", "status")
         self.complexity_column_id = self.monday_config.get("complexity_column_id")
         self.layers_column_id = self.monday_config.get("layers_column_id")
         self.status_mapping = self.monday_config.get("status_mapping", {})
+        self._idle = queue.SimpleQueue()  # kept-alive connections not in use
 
         if not self.api_token or self.api_token == "YOUR_MONDAY_API_TOKEN":
             raise ValueError(
@@ -65,32 +202,94 @@ class Adapter(BaseAdapter):
                 "Set 'monday.board_id' in .sync-config.json"
             )
 
-    def _graphql(self, query: str, variables: dict = None) -> dict:
-        """Execute a Monday.com GraphQL query."""
+    def _graphql(self, query: str, variables: dict = None, idempotent: bool = False) -> dict:
+        """Execute a Monday.com GraphQL query.
+
+        Pass idempotent=True when sending the mutation twice is harmless;
+        only then are gateway errors (502/503/504) retried.
+        """
         payload = {"query": query}
         if variables:
             payload["variables"] = variables
 
         data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            API_URL,
-            data=data,
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": self.api_token,
-                "API-Version": "2024-10",
-            },
-        )
-
-        try:
-            with urllib.request.urlopen(req) as resp:
-                result = json.loads(resp.read().decode("utf-8"))
-                if "errors" in result:
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": self.api_token,
+            "API-Version": "2024-10",
+        }
+        retry_statuses = _RETRY_STATUSES | _IDEMPOTENT_RETRY_STATUSES if idempotent else _RETRY_STATUSES
+
+        for attempt in range(_MAX_RETRIES + 1):
+            status, retry_after, body = self._post(data, headers)
+
+            if status < 400:
+                # json.loads detects the encoding of raw bytes itself
+                result = json.loads(body)
+                if "errors" not in result:
+                    return result.get("data", {})
+                # Only budget / rate-limit errors carry a retry hint. Partial
+                # data means some aliases were applied, so never resend those.
+                delay = None if result.get("data") else _retry_hint(result["errors"])
+                if delay is None or attempt == _MAX_RETRIES:
                     raise RuntimeError(f"Monday API error: {result['errors']}")
-                return result.get("data", {})
-        except urllib.error.HTTPError as e:
-            body = e.read().decode("utf-8")
-            raise RuntimeError(f"Monday API HTTP {e.code}: {body}")
+            else:
+                if status not in retry_statuses or attempt == _MAX_RETRIES:
+                    raise RuntimeError(f"Monday API HTTP {status}: {body.decode('utf-8', 'replace')}")
+                delay = _seconds(retry_after)
+                if delay is None:
+                    delay = _RETRY_BASE_DELAY * 2 ** attempt
+
+            time.sleep(delay)
+
+    def _post(self, data: bytes, headers: dict) -> tuple[int, str | None, bytes]:
+        """POST to the API over a kept-alive HTTPS connection.
+
+        Returns the status, the Retry-After header (if any) and the body.
+
+        Connections are reused across requests (and threads), so the TLS
+        handshake happens once per concurrent request slot rather than
+        once per request. If a pooled connection turns out to have been
+        dropped by the server while idle, the request is sent again on
+        another connection. Any other failure is raised, since the server
+        may already have applied the request.
+        """
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+                pooled = True
+            except queue.Empty:
+                conn = http.client.HTTPSConnection(_API.hostname)
+                pooled = False
+            try:
+                conn.request("POST", _API.path, body=data, headers=headers)
+                resp = conn.getresponse()
+                result = resp.status, resp.getheader("Retry-After"), resp.read()
+            except (http.client.RemoteDisconnected, BrokenPipeError):
+                conn.close()
+                if not pooled:
+                    raise
+                continue
+            except (ConnectionError, http.client.HTTPException):
+                conn.close()
+                raise
+            self._idle.put(conn)
+            return result
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _map_chunks(self, fn, items: list) -> list:
+        """Call fn on each _BATCH_SIZE chunk of items, returning results in order.
+
+        Chunks are independent requests, so up to max_concurrency of them
+        are in flight at once.
+        """
+        return self._map(fn, list(_chunks(items)))
 
     def create_item(
         self,
@@ -100,126 +299,121 @@ class Adapter(BaseAdapter):
         complexity: str = "M",
         layers: str = "",
     ) -> str:
-        # Build column values
+        return self.create_items([{
+            "title": title,
+            "status": status,
+            "description": description,
+            "complexity": complexity,
+            "layers": layers,
+        }])[0]
+
+    def create_items(self, items: list[dict]) -> list[str]:
+        """Create items with one aliased mutation per _BATCH_SIZE items.
+
+        Descriptions are added afterwards as a second batch of updates,
+        since each update needs the ID of its freshly created item.
+        """
+        item_ids = [
+            item_id
+            for chunk_ids in self._map_chunks(self._create_chunk, items)
+            for item_id in chunk_ids
+        ]
+
+        # Add descriptions as updates (Monday uses HTML in updates)
+        self._create_updates([
+            (item_id, item.get("description", ""))
+            for item_id, item in zip(item_ids, items)
+        ])
+
+        return item_ids
+
+    def _create_chunk(self, chunk: list[dict]) -> list[str]:
+        """Create up to _BATCH_SIZE items in a single aliased mutation."""
+        variables = {"board": self.board_id}
+        if self.group_id:
+            variables["group"] = self.group_id
+        for i, item in enumerate(chunk):
+            variables[f"name{i}"] = item["title"]
+            variables[f"values{i}"] = self._column_values(item)
+
+        result = self._graphql(_create_items_query(len(chunk), bool(self.group_id)), variables)
+
+        item_ids = []
+        for i in range(len(chunk)):
+            item_id = (result.get(f"m{i}") or {}).get("id")
+            if not item_id:
+                raise RuntimeError(f"Failed to create item: {result}")
+            item_ids.append(str(item_id))
+        return item_ids
+
+    def _column_values(self, item: dict) -> str:
+        """Build the JSON-encoded column_values for a new item."""
         column_values = {}
 
         # Status
+        status = item["status"]
         monday_status = self.status_mapping.get(status, status)
         column_values[self.status_column_id] = {"label": monday_status}
 
         # Complexity (if column configured)
         if self.complexity_column_id:
-            column_values[self.complexity_column_id] = {"label": complexity}
+            column_values[self.complexity_column_id] = {"label": item.get("complexity", "M")}
 
         # Layers (if column configured)
+        layers = item.get("layers", "")
         if self.layers_column_id and layers:
             column_values[self.layers_column_id] = layers
 
-        column_values_json = json.dumps(json.dumps(column_values))
+        return json.dumps(column_values)
 
-        # Resolve group_id from mapping
-        group_id = self.group_mapping.get(self.issues_file) or self.group_mapping.get("default")
-
-        # Build mutation
-        if group_id:
-            query = f"""
-                mutation {{
-                    create_item(
-                        board_id: {self.board_id},
-                        group_id: "{group_id}",
-                        item_name: "{self._escape(title)}",
-                        column_values: {column_values_json}
-                    ) {{
-                        id
-                    }}
-                }}
-            """
-        else:
-            query = f"""
-                mutation {{
-                    create_item(
-                        board_id: {self.board_id},
-                        item_name: "{self._escape(title)}",
-                        column_values: {column_values_json}
-                    ) {{
-                        id
-                    }}
-                }}
-            """
-
-        result = self._graphql(query)
-        item_id = result.get("create_item", {}).get("id")
-
-        if not item_id:
-            raise RuntimeError(f"Failed to create item: {result}")
-
-        # Add description as an update (Monday uses HTML in updates)
-        if description:
-            html_desc = self._to_html(description)
-            clean_desc = html_desc[:5000].replace('"', '\\"')
-            update_query = f"""
-                mutation {{
-                    create_update(
-                        item_id: {item_id},
-                        body: "{clean_desc}"
-                    ) {{
-                        id
-                    }}
-                }}
-            """
-            self._graphql(update_query)
-
-        return str(item_id)
+    def _create_updates(self, updates: list[tuple[str, str]]):
+        """Post (item_id, description) pairs as item updates, batched."""
+        updates = [(item_id, desc) for item_id, desc in updates if desc]
+        self._map_chunks(self._create_updates_chunk, updates)
+
+    def _create_updates_chunk(self, chunk: list[tuple[str, str]]):
+        """Post up to _BATCH_SIZE updates in a single aliased mutation."""
+        variables = {}
+        for i, (item_id, description) in enumerate(chunk):
+            variables[f"item{i}"] = item_id
+            variables[f"body{i}"] = self._update_body(description)
+
+        self._graphql(_create_updates_query(len(chunk)), variables)
+
+    def _update_body(self, description: str) -> str:
+        """Render a description as an HTML update body."""
+        return self._to_html(description[:_MAX_UPDATE_SOURCE])[:_MAX_UPDATE_HTML]
 
     def update_status(self, tracker_id: str, status: str):
-        monday_status = self.status_mapping.get(status, status)
-        column_value = json.dumps(json.dumps({"label": monday_status}))
-
-        query = f"""
-            mutation {{
-                change_column_value(
-                    board_id: {self.board_id},
-                    item_id: {tracker_id},
-                    column_id: "{self.status_column_id}",
-                    value: {column_value}
-                ) {{
-                    id
-                }}
-            }}
-        """
-        self._graphql(query)
+        self.update_statuses([(tracker_id, status)])
+
+    def update_statuses(self, updates: list[tuple[str, str]]):
+        """Change item statuses with one aliased mutation per _BATCH_SIZE items."""
+        self._map_chunks(self._change_statuses_chunk, updates)
+
+    def _change_statuses_chunk(self, chunk: list[tuple[str, str]]):
+        """Change up to _BATCH_SIZE statuses in a single aliased mutation."""
+        variables = {"board": self.board_id, "column": self.status_column_id}
+        for i, (tracker_id, status) in enumerate(chunk):
+            monday_status = self.status_mapping.get(status, status)
+            variables[f"item{i}"] = tracker_id
+            variables[f"value{i}"] = _status_value(monday_status)
+
+        self._graphql(_change_statuses_query(len(chunk)), variables, idempotent=True)
 
     def update_description(self, tracker_id: str, description: str):
-        if not description:
-            return
-        html_desc = self._to_html(description)
-        clean_desc = html_desc[:5000].replace('"', '\\"')
-        query = f"""
-            mutation {{
-                create_update(
-                    item_id: {tracker_id},
-                    body: "{clean_desc}"
-                ) {{
-                    id
-                }}
-            }}
-        """
-        self._graphql(query)
+        self._create_updates([(tracker_id, description)])
+
+    def update_descriptions(self, updates: list[tuple[str, str]]):
+        self._create_updates(updates)
 
     @staticmethod
     def _to_html(text: str) -> str:
         """Convert plain text summary to Monday-compatible HTML."""
-        import re as _re
         lines = text.split('\n')
         html_parts = []
         in_list = False
 
-        def _inline(s):
-            """Convert markdown inline formatting to HTML."""
-            s = _re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', s)
-            s = _re.sub(r'`(.+?)`', r'<code>\1</code>', s)
-            return s
-
         for line in lines:
             stripped = line.strip()
             if not stripped:
@@ -235,7 +429,7 @@ class Adapter(BaseAdapter):
                 continue
 
             # Checklist items
-            if stripped.startswith('✅ ') or stripped.startswith('☐ '):
+            if stripped.startswith(('✅ ', '☐ ')):
                 if not in_list:
                     html_parts.append('<ul>')
                     in_list = True
@@ -254,31 +448,29 @@ class Adapter(BaseAdapter):
         return ''.join(html_parts)
 
     def archive_item(self, tracker_id: str):
-        query = f"""
-            mutation {{
-                archive_item(item_id: {tracker_id}) {{
-                    id
-                }}
-            }}
-        """
-        self._graphql(query)
+        self.archive_items([tracker_id])
+
+    def archive_items(self, tracker_ids: list[str]):
+        """Archive items with one aliased mutation per _BATCH_SIZE items."""
+        self._map_chunks(self._archive_chunk, tracker_ids)
+
+    def _archive_chunk(self, chunk: list[str]):
+        """Archive up to _BATCH_SIZE items in a single aliased mutation."""
+        variables = {f"item{i}": tracker_id for i, tracker_id in enumerate(chunk)}
+        self._graphql(_archive_items_query(len(chunk)), variables, idempotent=True)
 
     def update_title(self, tracker_id: str, title: str):
-        query = f"""
-            mutation {{
-                change_simple_column_value(
-                    board_id: {self.board_id},
-                    item_id: {tracker_id},
-                    column_id: "name",
-                    value: "{self._escape(title)}"
-                ) {{
-                    id
-                }}
-            }}
-        """
-        self._graphql(query)
+        self.update_titles([(tracker_id, title)])
 
-    @staticmethod
-    def _escape(s: str) -> str:
-        """Escape a string for use in GraphQL."""
-        return s.replace("\\", "\\\\").replace('"', '\\"')
+    def update_titles(self, updates: list[tuple[str, str]]):
+        """Rename items with one aliased mutation per _BATCH_SIZE items."""
+        self._map_chunks(self._change_titles_chunk, updates)
+
+    def _change_titles_chunk(self, chunk: list[tuple[str, str]]):
+        """Rename up to _BATCH_SIZE items in a single aliased mutation."""
+        variables = {"board": self.board_id}
+        for i, (tracker_id, title) in enumerate(chunk):
+            variables[f"item{i}"] = tracker_id
+            variables[f"title{i}"] = title
+
+        self._graphql(_change_titles_query(len(chunk)), variables, idempotent=True)
@@ -10,21 +10,21 @@ Usage:
   ./sync-to-tracker.py specs/feature.issues.md --init        # first-time setup
   ./sync-to-tracker.py specs/feature.issues.md --dry-run     # preview changes
   ./sync-to-tracker.py specs/feature.issues.md --status      # show sync state
+  ./sync-to-tracker.py specs/feature.issues.md --status --full  # ...and unsynced issues
+  ./sync-to-tracker.py specs/feature.issues.md --print-state # dump state as JSON
 
 Config: .sync-config.json in project root
 State:  .sync-state.json in project root (auto-generated, commit to repo)
 """
 
+import io
+import re
 import sys
 import json
-import hashlib
-import argparse
+import functools
 from pathlib import Path
 
-# Add parent dir so we can import parse-issues
 SCRIPT_DIR = Path(__file__).parent
-sys.path.insert(0, str(SCRIPT_DIR.parent / "dev-loop"))
-from importlib import import_module
 
 
 def load_config() -> dict:
@@ -35,26 +35,55 @@ def load_config() -> dict:
         print("\nCreate one with:", file=sys.stderr)
         print(json.dumps(CONFIG_TEMPLATE, indent=2), file=sys.stderr)
         sys.exit(1)
-    return json.loads(config_path.read_text())
+    return json.loads(config_path.read_bytes())
 
 
-def load_sync_state(issues_file: str) -> dict:
-    """Load the sync state mapping for this issues file."""
+# Parsed state files by resolved path, as (mtime_ns, size, all_state). Reused
+# while the file is unchanged on disk, for read-only callers only.
+_STATE_CACHE: dict[str, tuple[int, int, dict]] = {}
+
+
+def load_sync_state(issues_file: str, writable: bool = False) -> tuple[dict, dict]:
+    """Load the sync state of all issues files and the mapping for this one.
+
+    Returns (all_state, state); pass both back to save_sync_state. Read-only
+    callers share a cached copy; pass writable=True to get a fresh one that
+    is safe to modify, even if saving it never happens.
+    """
     state_path = Path(".sync-state.json")
-    if not state_path.exists():
-        return {}
-    all_state = json.loads(state_path.read_text())
-    return all_state.get(issues_file, {})
+    try:
+        st = state_path.stat()
+    except FileNotFoundError:
+        return {}, {}
+
+    if writable:
+        all_state = json.loads(state_path.read_bytes())
+        return all_state, all_state.get(issues_file, {})
+
+    key = str(state_path.resolve())
+    cached = _STATE_CACHE.get(key)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        all_state = cached[2]
+    else:
+        all_state = json.loads(state_path.read_bytes())
+        _STATE_CACHE[key] = (st.st_mtime_ns, st.st_size, all_state)
+    return all_state, all_state.get(issues_file, {})
 
 
-def save_sync_state(issues_file: str, state: dict):
-    """Save the sync state mapping."""
+def save_sync_state(issues_file: str, state: dict, all_state: dict, pretty: bool = False):
+    """Save the sync state mapping.
+
+    The file is machine-generated, so it is written compactly unless
+    pretty is set (config "pretty_state"); --print-state shows it indented.
+    """
     state_path = Path(".sync-state.json")
-    all_state = {}
-    if state_path.exists():
-        all_state = json.loads(state_path.read_text())
     all_state[issues_file] = state
-    state_path.write_text(json.dumps(all_state, indent=2) + "\n")
+    if pretty:
+        data = json.dumps(all_state, indent=2) + "\n"
+    else:
+        data = json.dumps(all_state, separators=(",", ":")) + "\n"
+    state_path.write_bytes(data.encode())
+    _STATE_CACHE.pop(str(state_path.resolve()), None)
 
 
 def get_adapter(config: dict, issues_file: str = ""):
@@ -64,6 +93,9 @@ def get_adapter(config: dict, issues_file: str = ""):
         print("ERROR: 'tracker' not specified in .sync-config.json", file=sys.stderr)
         sys.exit(1)
 
+    # Imported here so --status and --dry-run never pay for the adapters
+    from importlib import import_module
+
     adapter_module = f"adapters.{tracker}"
     try:
         mod = import_module(adapter_module)
@@ -75,21 +107,26 @@ def get_adapter(config: dict, issues_file: str = ""):
         sys.exit(1)
 
 
+# dev-loop's parse_issues, loaded on first use
+_parse_issues_fn = None
+
+
 def parse_issues_file(filepath: str) -> list[dict]:
     """Parse the issues file using the dev-loop parser."""
-    sys.path.insert(0, str(SCRIPT_DIR.parent / "dev-loop"))
-    from pathlib import Path as P
-    # Import inline to avoid circular deps
-    parse_mod_path = SCRIPT_DIR.parent / "dev-loop" / "parse-issues.py"
-    if not parse_mod_path.exists():
-        print(f"ERROR: parse-issues.py not found at {parse_mod_path}", file=sys.stderr)
-        sys.exit(1)
-
-    import importlib.util
-    spec = importlib.util.spec_from_file_location("parse_issues", str(parse_mod_path))
-    mod = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(mod)
-    return mod.parse_issues(filepath)
+    global _parse_issues_fn
+    if _parse_issues_fn is None:
+        # Import inline to avoid circular deps
+        parse_mod_path = SCRIPT_DIR.parent / "dev-loop" / "parse-issues.py"
+        if not parse_mod_path.exists():
+            print(f"ERROR: parse-issues.py not found at {parse_mod_path}", file=sys.stderr)
+            sys.exit(1)
+
+        import importlib.util
+        spec = importlib.util.spec_from_file_location("parse_issues", str(parse_mod_path))
+        mod = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(mod)
+        _parse_issues_fn = mod.parse_issues
+    return _parse_issues_fn(filepath)
 
 
 # --- Status mapping ---------------------------------------------------------
@@ -126,15 +163,53 @@ CONFIG_TEMPLATE = {
 
 
 # --- Colors -----------------------------------------------------------------
-RED = '\033[0;31m'
-GREEN = '\033[0;32m'
-YELLOW = '\033[1;33m'
-BLUE = '\033[0;34m'
-CYAN = '\033[0;36m'
-BOLD = '\033[1m'
-NC = '\033[0m'
+class C:
+    """ANSI colors, blanked when stdout is not a terminal (pipes, CI logs)."""
+    RED = '\033[0;31m'
+    GREEN = '\033[0;32m'
+    YELLOW = '\033[1;33m'
+    BLUE = '\033[0;34m'
+    CYAN = '\033[0;36m'
+    BOLD = '\033[1m'
+    NC = '\033[0m'
+
 
+if not sys.stdout.isatty():
+    for _name in ("RED", "GREEN", "YELLOW", "BLUE", "CYAN", "BOLD", "NC"):
+        setattr(C, _name, "")
 
+
+# Progress lines are buffered and written in batches instead of one write
+# per line; each command flushes whatever is left when it finishes.
+_OUT: list[str] = []
+_FLUSH_EVERY = 32
+
+
+def _emit(line: str = ""):
+    """Queue a line of output, writing the buffer out every _FLUSH_EVERY lines."""
+    _OUT.append(line)
+    if len(_OUT) >= _FLUSH_EVERY:
+        _flush()
+
+
+def _flush():
+    """Write out all queued output lines."""
+    if _OUT:
+        sys.stdout.write("\n".join(_OUT) + "\n")
+        _OUT.clear()
+    sys.stdout.flush()
+
+
+# Markdown headers (which covers "### ISSUE-") and metadata fields — these
+# are for the tooling, not content. Stripped in one pass before the scan.
+_SKIPPED_LINE_RE = re.compile(
+    r'^[^\S\n]*(?:#|\*\*(?:Status|Dependencies|Complexity|Layers'
+    r'|Files likely touched|Dev notes):\*\*).*\n?',
+    re.M,
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def extract_human_summary(raw_block: str) -> str:
     """Extract a clean, human-readable summary from a raw issue block.
     
@@ -145,35 +220,25 @@ def extract_human_summary(raw_block: str) -> str:
     Strips all metadata fields (Status, Dependencies, Complexity, etc.)
     since those are for the tooling, not for humans reading Monday.
     """
-    lines = raw_block.split('\n')
+    # Iterate lines lazily; StringIO splits on '\n' only, like str.split
+    lines = io.StringIO(_SKIPPED_LINE_RE.sub('', raw_block))
     
     description_lines = []
     acceptance_lines = []
     section = None
     
-    # Fields to skip — these are metadata, not content
-    metadata_prefixes = (
-        '### ISSUE-', '**Status:**', '**Dependencies:**', '**Complexity:**',
-        '**Layers:**', '**Files likely touched:**', '**Dev notes:**',
-    )
-    
     for line in lines:
         stripped = line.strip()
         
-        # Skip empty lines at the start
-        if not stripped and not description_lines and section is None:
+        # Blank lines carry no content in either section
+        if not stripped:
             continue
 
-        # Skip markdown headers (##, ###, etc.)
-        if stripped.startswith('#'):
-            continue
-            
-        # Skip metadata fields
-        if any(stripped.startswith(prefix) for prefix in metadata_prefixes):
-            continue
-        
+        # Every field label starts with '**'; check it once per line
+        is_field = stripped.startswith('**')
+
         # Detect acceptance criteria section
-        if stripped.startswith('**Acceptance criteria:**'):
+        if is_field and stripped.startswith('**Acceptance criteria:**'):
             section = 'acceptance'
             continue
         
@@ -183,13 +248,13 @@ def extract_human_summary(raw_block: str) -> str:
                 # Convert markdown checkbox to plain text
                 criterion = stripped.replace('- [x] ', '✅ ').replace('- [ ] ', '☐ ')
                 acceptance_lines.append(criterion)
-            elif stripped and not stripped.startswith('**'):
-                acceptance_lines.append(stripped)
-            elif stripped.startswith('**'):
+            elif is_field:
                 section = None  # Hit next field, stop
+            else:
+                acceptance_lines.append(stripped)
         
         # Collect description (prose paragraphs between metadata and acceptance)
-        elif section is None and stripped and not stripped.startswith('**'):
+        elif not is_field:
             description_lines.append(stripped)
     
     parts = []
@@ -201,16 +266,33 @@ def extract_human_summary(raw_block: str) -> str:
     return '\n'.join(parts) if parts else ''
 
 
+# Hashes written before the switch to BLAKE2 were 12-char truncated MD5s
+_LEGACY_HASH_LEN = 12
+
+
 def _hash(text: str) -> str:
     """Short hash of text content for change detection."""
-    return hashlib.md5(text.encode()).hexdigest()[:12] if text else ""
+    import hashlib
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest() if text else ""
 
 
 def sync(issues_file: str, dry_run: bool = False):
     """Main sync logic."""
-    config = load_config()
-    adapter = get_adapter(config, issues_file=issues_file)
-    state = load_sync_state(issues_file)
+    try:
+        config = load_config()
+        if dry_run:
+            # A dry run never talks to the tracker, so skip importing the adapter
+            _sync(issues_file, config, None, dry_run)
+            return
+        with get_adapter(config, issues_file=issues_file) as adapter:
+            _sync(issues_file, config, adapter, dry_run)
+    finally:
+        _flush()
+
+
+def _sync(issues_file: str, config: dict, adapter, dry_run: bool):
+    """Sync the issues file through adapter (None on a dry run)."""
+    all_state, state = load_sync_state(issues_file, writable=not dry_run)
     issues = parse_issues_file(issues_file)
 
     created = 0
@@ -221,144 +303,190 @@ def sync(issues_file: str, dry_run: bool = False):
     issue_ids = {issue["id"] for issue in issues}
 
     # --- Archive orphaned issues (in state but not in .issues.md) -----------
-    orphaned = [iid for iid in list(state.keys()) if iid not in issue_ids]
+    orphaned = [iid for iid in state if iid not in issue_ids]
+    if orphaned and not dry_run:
+        adapter.archive_items([state[iid]["tracker_id"] for iid in orphaned])
     for issue_id in orphaned:
-        tracker_item = state[issue_id]
         if dry_run:
-            print(f"  {RED}[ARCHIVE]{NC}  {issue_id}  (removed from .issues.md)")
+            _emit(f"  {C.RED}[ARCHIVE]{C.NC}  {issue_id}  (removed from .issues.md)")
         else:
-            adapter.archive_item(tracker_item["tracker_id"])
             del state[issue_id]
-            print(f"  {RED}✓ Archived{NC}  {issue_id}")
+            _emit(f"  {C.RED}✓ Archived{C.NC}  {issue_id}")
         archived += 1
 
     # --- Create / update issues ---------------------------------------------
+    # Changes are collected here and pushed in bulk after the loop, so the
+    # adapter can batch them into as few requests as its API allows.
+    to_create = []          # (issue_id, title, create_item kwargs, summary_hash)
+    to_update_title = []    # (issue_id, tracker_id, full_title, title)
+    to_update_status = []   # (issue_id, tracker_id, status)
+    to_update_desc = []     # (issue_id, tracker_id, summary, summary_hash)
+
     for issue in issues:
         issue_id = issue["id"]
         normalized_status = NORMALIZED_STATUSES.get(issue["status"], "backlog")
         tracker_item = state.get(issue_id)
         summary = extract_human_summary(issue.get("raw_block", ""))
         summary_hash = _hash(summary)
+        full_title = f"{issue_id}: {issue['title']}"
 
         if tracker_item is None:
             # --- New issue: create in tracker --------------------------------
             if dry_run:
-                print(f"  {GREEN}[CREATE]{NC}  {issue_id}: {issue['title']}  →  {normalized_status}")
+                _emit(f"  {C.GREEN}[CREATE]{C.NC}  {issue_id}: {issue['title']}  →  {normalized_status}")
             else:
-                full_title = f"{issue_id}: {issue['title']}"
-                tracker_id = adapter.create_item(
-                    title=full_title,
-                    status=normalized_status,
-                    description=summary,
-                    complexity=issue.get("complexity", "M"),
-                    layers=issue.get("layers", ""),
-                )
-                state[issue_id] = {
-                    "tracker_id": tracker_id,
-                    "last_status": normalized_status,
-                    "last_title": full_title,
-                    "description_hash": summary_hash,
-                }
-                print(f"  {GREEN}✓ Created{NC}  {issue_id}: {issue['title']}  →  {tracker_id}")
+                to_create.append((issue_id, issue["title"], {
+                    "title": full_title,
+                    "status": normalized_status,
+                    "description": summary,
+                    "complexity": issue.get("complexity", "M"),
+                    "layers": issue.get("layers", ""),
+                }, summary_hash))
             created += 1
 
         else:
             # --- Existing issue: check for changes ---------------------------
-            full_title = f"{issue_id}: {issue['title']}"
             status_changed = tracker_item.get("last_status") != normalized_status
             title_changed = tracker_item.get("last_title") != full_title
-            desc_changed = tracker_item.get("description_hash") != summary_hash
+            # Only push descriptions if a hash existed before (not first-time backfill)
+            # Legacy MD5 hashes count as missing: backfilled, not re-pushed
+            stored_hash = tracker_item.get("description_hash")
+            has_hash = stored_hash is not None and len(stored_hash) != _LEGACY_HASH_LEN
+            desc_changed = stored_hash != summary_hash
 
             if title_changed and "last_title" in tracker_item:
                 if dry_run:
-                    print(f"  {CYAN}[TITLE]{NC}  {issue_id}: → {issue['title']}")
+                    _emit(f"  {C.CYAN}[TITLE]{C.NC}  {issue_id}: → {issue['title']}")
                 else:
-                    adapter.update_title(
-                        tracker_id=tracker_item["tracker_id"],
-                        title=full_title,
-                    )
-                    state[issue_id]["last_title"] = full_title
-                    print(f"  {CYAN}✓ Title{NC}  {issue_id}: → {issue['title']}")
+                    to_update_title.append((issue_id, tracker_item["tracker_id"], full_title, issue["title"]))
                 updated += 1
-            elif "last_title" not in tracker_item:
+            elif "last_title" not in tracker_item and not dry_run:
                 # Backfill title silently
                 state[issue_id]["last_title"] = full_title
 
             if status_changed:
                 if dry_run:
-                    print(f"  {YELLOW}[UPDATE]{NC}  {issue_id}: {tracker_item['last_status']} → {normalized_status}")
+                    _emit(f"  {C.YELLOW}[UPDATE]{C.NC}  {issue_id}: {tracker_item['last_status']} → {normalized_status}")
                 else:
-                    adapter.update_status(
-                        tracker_id=tracker_item["tracker_id"],
-                        status=normalized_status,
-                    )
-                    state[issue_id]["last_status"] = normalized_status
-                    # Backfill hash if missing
-                    if "description_hash" not in state[issue_id]:
-                        state[issue_id]["description_hash"] = summary_hash
-                    print(f"  {YELLOW}✓ Status{NC}  {issue_id}: → {normalized_status}")
+                    to_update_status.append((issue_id, tracker_item["tracker_id"], normalized_status))
                 updated += 1
 
-            if desc_changed and summary and "description_hash" in tracker_item:
-                # Only push description if hash existed before (not first-time backfill)
+            if desc_changed and summary and has_hash:
                 if dry_run:
-                    print(f"  {CYAN}[DESC]{NC}  {issue_id}: description changed")
+                    _emit(f"  {C.CYAN}[DESC]{C.NC}  {issue_id}: description changed")
                 else:
-                    adapter.update_description(
-                        tracker_id=tracker_item["tracker_id"],
-                        description=summary,
-                    )
-                    state[issue_id]["description_hash"] = summary_hash
-                    print(f"  {CYAN}✓ Desc{NC}  {issue_id}: description updated")
+                    to_update_desc.append((issue_id, tracker_item["tracker_id"], summary, summary_hash))
                 updated += 1
-            elif "description_hash" not in tracker_item:
+            elif not has_hash and not dry_run:
                 # Backfill hash silently
                 state[issue_id]["description_hash"] = summary_hash
 
-            if not status_changed and not title_changed and not (desc_changed and "description_hash" in tracker_item):
+            if not status_changed and not title_changed and not (desc_changed and has_hash):
                 unchanged += 1
 
+    # --- Push collected changes ---------------------------------------------
+    if to_update_title:
+        adapter.update_titles([(tracker_id, full_title) for _, tracker_id, full_title, _ in to_update_title])
+        for issue_id, _, full_title, title in to_update_title:
+            state[issue_id]["last_title"] = full_title
+            _emit(f"  {C.CYAN}✓ Title{C.NC}  {issue_id}: → {title}")
+
+    if to_create:
+        tracker_ids = adapter.create_items([item for _, _, item, _ in to_create])
+        for (issue_id, title, item, summary_hash), tracker_id in zip(to_create, tracker_ids):
+            state[issue_id] = {
+                "tracker_id": tracker_id,
+                "last_status": item["status"],
+                "last_title": item["title"],
+                "description_hash": summary_hash,
+            }
+            _emit(f"  {C.GREEN}✓ Created{C.NC}  {issue_id}: {title}  →  {tracker_id}")
+
+    if to_update_status:
+        adapter.update_statuses([(tracker_id, status) for _, tracker_id, status in to_update_status])
+        for issue_id, _, status in to_update_status:
+            state[issue_id]["last_status"] = status
+            _emit(f"  {C.YELLOW}✓ Status{C.NC}  {issue_id}: → {status}")
+
+    if to_update_desc:
+        adapter.update_descriptions([(tracker_id, summary) for _, tracker_id, summary, _ in to_update_desc])
+        for issue_id, _, _, summary_hash in to_update_desc:
+            state[issue_id]["description_hash"] = summary_hash
+            _emit(f"  {C.CYAN}✓ Desc{C.NC}  {issue_id}: description updated")
+
     if not dry_run:
-        save_sync_state(issues_file, state)
+        save_sync_state(issues_file, state, all_state, pretty=config.get("pretty_state", False))
 
     # --- Summary
-    print()
+    _emit()
     label = "[DRY RUN] " if dry_run else ""
-    print(f"  {label}{GREEN}{created} created{NC}  {YELLOW}{updated} updated{NC}  {RED}{archived} archived{NC}  {unchanged} unchanged")
+    _emit(f"  {label}{C.GREEN}{created} created{C.NC}  {C.YELLOW}{updated} updated{C.NC}  {C.RED}{archived} archived{C.NC}  {unchanged} unchanged")
 
 
-def show_status(issues_file: str):
-    """Show current sync state."""
-    state = load_sync_state(issues_file)
-    issues = parse_issues_file(issues_file)
+def show_status(issues_file: str, full: bool = False):
+    """Show current sync state.
 
-    if not state:
-        print("  No sync state found. Run with --init or sync first.")
-        return
+    By default only the state file is read. With full=True the issues file
+    is parsed too, so issues that were never synced are listed as well.
+    """
+    try:
+        all_state, state = load_sync_state(issues_file)
+
+        if not state:
+            _emit("  No sync state found. Run with --init or sync first.")
+            return
+
+        if not full:
+            for issue_id, tracker_item in state.items():
+                # last_title is the full "ISSUE-N: title" pushed to the tracker
+                title = tracker_item.get("last_title") or issue_id
+                synced = f"{C.GREEN}synced{C.NC} → {tracker_item['tracker_id']}  (last: {tracker_item['last_status']})"
+                _emit(f"  {title}  [{synced}]")
+            return
+
+        for issue in parse_issues_file(issues_file):
+            issue_id = issue["id"]
+            tracker_item = state.get(issue_id)
+            if tracker_item:
+                synced = f"{C.GREEN}synced{C.NC} → {tracker_item['tracker_id']}  (last: {tracker_item['last_status']})"
+            else:
+                synced = f"{C.RED}not synced{C.NC}"
+            _emit(f"  {issue_id}: {issue['title']}  [{synced}]")
+    finally:
+        _flush()
 
-    for issue in issues:
-        issue_id = issue["id"]
-        tracker_item = state.get(issue_id)
-        if tracker_item:
-            synced = f"{GREEN}synced{NC} → {tracker_item['tracker_id']}  (last: {tracker_item['last_status']})"
-        else:
-            synced = f"{RED}not synced{NC}"
-        print(f"  {issue_id}: {issue['title']}  [{synced}]")
+
+def print_state(issues_file: str):
+    """Pretty-print the stored sync state for an issues file."""
+    _, state = load_sync_state(issues_file)
+    sys.stdout.write(json.dumps(state, indent=2) + "\n")
 
 
 def resync_descriptions(issues_file: str, dry_run: bool = False):
     """Re-push descriptions for all synced issues."""
-    config = load_config()
-    adapter = get_adapter(config, issues_file=issues_file)
-    state = load_sync_state(issues_file)
+    try:
+        config = load_config()
+        if dry_run:
+            _resync_descriptions(issues_file, config, None, dry_run)
+            return
+        with get_adapter(config, issues_file=issues_file) as adapter:
+            _resync_descriptions(issues_file, config, adapter, dry_run)
+    finally:
+        _flush()
+
+
+def _resync_descriptions(issues_file: str, config: dict, adapter, dry_run: bool):
+    """Re-push descriptions through adapter (None on a dry run)."""
+    all_state, state = load_sync_state(issues_file, writable=not dry_run)
     issues = parse_issues_file(issues_file)
 
     if not state:
-        print("  No sync state found. Run sync first to create issues.")
+        _emit("  No sync state found. Run sync first to create issues.")
         return
 
     updated = 0
     skipped = 0
+    to_update = []  # (issue_id, title, tracker_id, summary)
 
     for issue in issues:
         issue_id = issue["id"]
@@ -374,29 +502,35 @@ def resync_descriptions(issues_file: str, dry_run: bool = False):
             continue
 
         if dry_run:
-            print(f"  {YELLOW}[RESYNC]{NC}  {issue_id}: {issue['title']}")
+            _emit(f"  {C.YELLOW}[RESYNC]{C.NC}  {issue_id}: {issue['title']}")
         else:
-            adapter.update_description(tracker_item["tracker_id"], summary)
-            state[issue_id]["description_hash"] = _hash(summary)
-            print(f"  {YELLOW}✓ Updated{NC}  {issue_id}: {issue['title']}")
+            to_update.append((issue_id, issue["title"], tracker_item["tracker_id"], summary))
         updated += 1
 
     if not dry_run:
-        save_sync_state(issues_file, state)
+        adapter.update_descriptions([(tracker_id, summary) for _, _, tracker_id, summary in to_update])
+        for issue_id, title, _, summary in to_update:
+            state[issue_id]["description_hash"] = _hash(summary)
+            _emit(f"  {C.YELLOW}✓ Updated{C.NC}  {issue_id}: {title}")
+        save_sync_state(issues_file, state, all_state, pretty=config.get("pretty_state", False))
 
-    print()
+    _emit()
     label = "[DRY RUN] " if dry_run else ""
-    print(f"  {label}{YELLOW}{updated} updated{NC}  {skipped} skipped")
+    _emit(f"  {label}{C.YELLOW}{updated} updated{C.NC}  {skipped} skipped")
 
 
 # --- CLI --------------------------------------------------------------------
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="Sync .issues.md to project tracker")
     parser.add_argument("issues_file", help="Path to .issues.md file")
     parser.add_argument("--init", action="store_true", help="Initialize: create all issues in tracker")
     parser.add_argument("--dry-run", action="store_true", help="Preview changes without syncing")
     parser.add_argument("--resync", action="store_true", help="Re-push descriptions for all existing issues")
     parser.add_argument("--status", action="store_true", help="Show current sync state")
+    parser.add_argument("--full", action="store_true", help="With --status, also list issues not yet synced")
+    parser.add_argument("--print-state", action="store_true", help="Print the stored sync state as indented JSON")
 
     args = parser.parse_args()
 
@@ -404,12 +538,19 @@ def main():
         print(f"ERROR: {args.issues_file} not found", file=sys.stderr)
         sys.exit(1)
 
-    print()
-    print(f"  {BOLD}{CYAN}sync-to-tracker{NC}  ←  {args.issues_file}")
-    print()
+    if args.print_state:
+        # Bare JSON, no banner, so the output can be piped or diffed
+        print_state(args.issues_file)
+        return
+
+    _emit()
+    _emit(f"  {C.BOLD}{C.CYAN}sync-to-tracker{C.NC}  ←  {args.issues_file}")
+    _emit()
+    _flush()  # Header goes out ahead of any errors on stderr
 
+    # Each command flushes its own output
     if args.status:
-        show_status(args.issues_file)
+        show_status(args.issues_file, full=args.full)
     elif args.resync:
         resync_descriptions(args.issues_file, dry_run=args.dry_run)
     else: